@@ -0,0 +1,42 @@
+#region imports
+import os
+import sys
+#endregion
+
+#region function definitions
+def make_io():
+    """
+    Build the prompt/print pair used by the interactive homework programs.
+    By default this is just input()/print(), which works in a terminal, an IDE run console, or a pipe.
+    Batch mode is opt-in: set the environment variable HW_BATCH_IO=1 (e.g. for scripted grading runs)
+    to read every answer from stdin up front and collect all output, prompts included, so it can be
+    written in one call by flush().  Each prompt is recorded with its answer, as a terminal would show it.
+    Callers should call flush() in a finally block so output already produced is not lost
+    if the program raises part way through.
+    :return: tuple (ask, say, flush)
+        ask(prompt) -> str: the next answer (in batch mode, an empty string once the answers run out,
+                            which behaves like pressing Enter)
+        say(text): print a line (or buffer it in batch mode)
+        flush(): write any buffered output
+    """
+    if os.environ.get("HW_BATCH_IO", "") not in ("1", "true", "yes"):
+        return input, print, lambda: None
+
+    answers = iter(sys.stdin.read().splitlines())
+    out_lines = []
+
+    def ask(prompt=""):
+        answer = next(answers, "")
+        out_lines.append(prompt + answer)
+        return answer
+
+    def say(text=""):
+        out_lines.append(text)
+
+    def flush():
+        if out_lines:
+            sys.stdout.write("\n".join(out_lines) + "\n")
+            out_lines.clear()
+
+    return ask, say, flush
+#endregion
@@ -1,5 +1,8 @@
 # region imports
+from math import erf, sqrt
+from consoleIO import make_io
 from numericalMethods import GPDF, Probability
+from scipy.special import ndtr, ndtri
 
 
 # endregion
@@ -21,107 +24,111 @@ def main():
     OneSided = True
     yesOptions = ["y", "yes", "true"]
 
-    Again = True
-    while Again:
-        print("\nDo you want to find 'p' (probability) given c, OR find 'c' given p?")
-        mode = input("Type 'p' or 'c': ").strip().lower()
-
-        # 1) Ask for mean/stDev
-        resp = input(f"Population mean? (default={mean:.3f}): ").strip()
-        if resp:
-            mean = float(resp)
-        resp = input(f"Standard deviation? (default={stDev:.3f}): ").strip()
-        if resp:
-            stDev = float(resp)
-
-        # 2) Ask if Probability is greater than c
-        resp = input(f"Probability greater than c? (y/n) (default={GT}): ").strip().lower()
-        if resp in yesOptions:
-            GT = True
-        elif resp != "":
-            GT = False
-
-        # 3) Ask if one-sided
-        resp = input(f"One-sided? (y/n) (default={OneSided}): ").strip().lower()
-        if resp in yesOptions:
-            OneSided = True
-        elif resp != "":
-            OneSided = False
-
-        if mode == 'p':
-            ############################################################
-            # USER WANTS TO FIND THE PROBABILITY GIVEN c
-            ############################################################
-            resp = input(f"Enter c (default={c_val:.3f}): ").strip()
-            if resp:
-                c_val = float(resp)
-
-            # Now compute probability from c_val
-            if OneSided:
-                # Use Probability function directly
-                result_p = Probability(GPDF, (mean, stDev), c_val, GT=GT)
-                print(
-                    f"\nResult => P(x{'>' if GT else '<'}{c_val:.2f} | mean={mean:.2f}, std={stDev:.2f}) = {result_p:.4f}")
-            else:
-                # TWO-SIDED logic: "prob = 1 - 2 * Probability(..., GT=True)" from your code
-                p_inside = 1 - 2 * Probability(GPDF, (mean, stDev), c_val, GT=True)
-                if GT:
-                    # Original code prints the "outside" portion
-                    print(
-                        f"\nResult => P({mean - (c_val - mean):.2f} > x > {mean + (c_val - mean):.2f} | {mean:.2f}, {stDev:.2f}) = {1 - p_inside:.4f}")
-                else:
-                    print(
-                        f"\nResult => P({mean - (c_val - mean):.2f} < x < {mean + (c_val - mean):.2f} | {mean:.2f}, {stDev:.2f}) = {p_inside:.4f}")
-
-        elif mode == 'c':
-            ############################################################
-            # USER WANTS TO FIND c GIVEN A PROBABILITY
-            ############################################################
-            resp = input(f"Enter desired probability p (default={p_val:.3f}): ").strip()
-            if resp:
-                p_val = float(resp)
+    ask, say, flush = make_io()
 
-            # We'll do a simple bisection to find c in [mean-5*stDev, mean+5*stDev]
-            left, right = mean - 5.0 * stDev, mean + 5.0 * stDev
+    try:
+        Again = True
+        while Again:
+            say("\nDo you want to find 'p' (probability) given c, OR find 'c' given p?")
+            mode = ask("Type 'p' or 'c': ").strip().lower()
 
-            def f(c_test):
+            # 1) Ask for mean/stDev
+            resp = ask(f"Population mean? (default={mean:.3f}): ").strip()
+            if resp:
+                mean = float(resp)
+            resp = ask(f"Standard deviation? (default={stDev:.3f}): ").strip()
+            if resp:
+                stDev = float(resp)
+
+            # 2) Ask if Probability is greater than c
+            resp = ask(f"Probability greater than c? (y/n) (default={GT}): ").strip().lower()
+            if resp in yesOptions:
+                GT = True
+            elif resp != "":
+                GT = False
+
+            # 3) Ask if one-sided
+            resp = ask(f"One-sided? (y/n) (default={OneSided}): ").strip().lower()
+            if resp in yesOptions:
+                OneSided = True
+            elif resp != "":
+                OneSided = False
+
+            if mode == 'p':
+                ############################################################
+                # USER WANTS TO FIND THE PROBABILITY GIVEN c
+                ############################################################
+                resp = ask(f"Enter c (default={c_val:.3f}): ").strip()
+                if resp:
+                    c_val = float(resp)
+
+                # Now compute probability from c_val
                 if OneSided:
-                    # Probability(...) with GT
-                    p_test = Probability(GPDF, (mean, stDev), c_test, GT=GT)
-                else:
-                    # two-sided inside
-                    p_inside = 1 - 2 * Probability(GPDF, (mean, stDev), c_test, GT=True)
-                    p_test = (1 - p_inside) if GT else p_inside
-                return p_test - p_val
-
-            # Bisection
-            for _ in range(50):
-                mid = 0.5 * (left + right)
-                if f(left) * f(mid) < 0:
-                    right = mid
+                    # Use Probability function directly
+                    result_p = Probability(GPDF, (mean, stDev), c_val, GT=GT)
+                    say(
+                        f"\nResult => P(x{'>' if GT else '<'}{c_val:.2f} | mean={mean:.2f}, std={stDev:.2f}) = {result_p:.4f}")
                 else:
-                    left = mid
-                if abs(right - left) < 1e-7:
-                    break
-            c_solution = 0.5 * (left + right)
-
-            # Display result
-            # Compute final probability at that c for clarity
-            final_p = f(c_solution) + p_val  # i.e. p_val + (p_test - p_val) = p_test
-            if OneSided:
-                print(f"\nFound c ≈ {c_solution:.4f} => Probability P(x{'>' if GT else '<'}c) ≈ {final_p:.4f}")
-            else:
-                if GT:
-                    print(f"\nFound c ≈ {c_solution:.4f} => Outside Probability ≈ {final_p:.4f}")
+                    # TWO-SIDED logic: the inside probability 1 - 2 * P(x>c) is, by symmetry of the
+                    # Gaussian about the mean, exactly erf(|c-mean| / (stDev*sqrt(2))) -- no integration needed
+                    d = abs(c_val - mean)  # half-width of the interval, used for both the value and the label
+                    p_inside = erf(d / (stDev * sqrt(2.0)))
+                    if GT:
+                        # Original code prints the "outside" portion
+                        say(
+                            f"\nResult => P({mean - d:.2f} > x > {mean + d:.2f} | {mean:.2f}, {stDev:.2f}) = {1 - p_inside:.4f}")
+                    else:
+                        say(
+                            f"\nResult => P({mean - d:.2f} < x < {mean + d:.2f} | {mean:.2f}, {stDev:.2f}) = {p_inside:.4f}")
+
+            elif mode == 'c':
+                ############################################################
+                # USER WANTS TO FIND c GIVEN A PROBABILITY
+                ############################################################
+                resp = ask(f"Enter desired probability p (default={p_val:.3f}): ").strip()
+                p_new = float(resp) if resp else p_val
+
+                if not 0.0 < p_new < 1.0:
+                    # ndtri is only finite for 0 < q < 1; keep the previous p as the default
+                    say(f"Invalid probability {p_new} (must be strictly between 0 and 1).")
                 else:
-                    print(f"\nFound c ≈ {c_solution:.4f} => Inside Probability ≈ {final_p:.4f}")
+                    p_val = p_new
+
+                    # Invert the Gaussian CDF directly with ndtri instead of searching for c.
+                    # ndtri(q) returns the standard normal z such that P(Z<z) = q.
+                    if OneSided:
+                        # P(x>c) = p  <=>  P(x<c) = 1 - p
+                        q = (1.0 - p_val) if GT else p_val
+                    else:
+                        # two-sided: inside probability P(mean-d < x < mean+d) = 2*P(Z<d/stDev) - 1
+                        p_inside = (1.0 - p_val) if GT else p_val
+                        q = 0.5 + 0.5 * p_inside
+                    c_solution = mean + stDev * float(ndtri(q))
+
+                    # Display result
+                    # Evaluate the probability at c_solution in closed form as a check on the answer
+                    if OneSided:
+                        p_less = float(ndtr((c_solution - mean) / stDev))
+                        final_p = (1.0 - p_less) if GT else p_less
+                    else:
+                        p_inside = erf(abs(c_solution - mean) / (stDev * sqrt(2.0)))
+                        final_p = (1.0 - p_inside) if GT else p_inside
+                    if OneSided:
+                        say(f"\nFound c ≈ {c_solution:.4f} => Probability P(x{'>' if GT else '<'}c) ≈ {final_p:.4f}")
+                    else:
+                        if GT:
+                            say(f"\nFound c ≈ {c_solution:.4f} => Outside Probability ≈ {final_p:.4f}")
+                        else:
+                            say(f"\nFound c ≈ {c_solution:.4f} => Inside Probability ≈ {final_p:.4f}")
 
-        else:
-            print("Invalid choice (must be 'p' or 'c').")
+            else:
+                say("Invalid choice (must be 'p' or 'c').")
 
-        # Ask if user wants to go again
-        resp = input("Go again? (y/n): ").strip().lower()
-        Again = True if resp in yesOptions else False
+            # Ask if user wants to go again
+            resp = ask("Go again? (y/n): ").strip().lower()
+            Again = True if resp in yesOptions else False
+    finally:
+        flush()  # write whatever was produced, even if an exception was raised
 
 
 if __name__ == "__main__":
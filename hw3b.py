@@ -1,10 +1,19 @@
+import functools
 import math
-
-def gamma(z):
+import sys
+import numpy as np
+from scipy.integrate import quad
+from scipy.special import stdtr
+from consoleIO import make_io
+
+@functools.lru_cache(maxsize=128)
+def _K_m(m):
     """
-    Wrapper around math.gamma (Python 3.8+) so that we can refer to it simply as gamma().
+    Normalizing constant K_m = Gamma((m+1)/2) / [ sqrt(m*pi) * Gamma(m/2) ].
+    Memoized so repeated queries with the same m (e.g. scanning a Table A9 column) reuse it.
+    The gamma ratio is formed from math.lgamma, since math.gamma overflows for m above ~340.
     """
-    return math.gamma(z)
+    return math.exp(math.lgamma((m+1)/2.0) - math.lgamma(m/2.0)) / math.sqrt(m*math.pi)
 
 def t_pdf(u, m):
     """
@@ -12,90 +21,164 @@ def t_pdf(u, m):
     t_pdf(u; m) = K_m * (1 + u^2 / m)^(-(m+1)/2)
     where
        K_m = Gamma((m+1)/2) / [ sqrt(m*pi) * Gamma(m/2) ].
+    u may be a scalar or a NumPy array; arrays are evaluated element-wise.
+    """
+    return _t_pdf_kernel(u, m, _K_m(m), -(m+1)/2.0)
+
+def _t_pdf_kernel(u, m, K_m, exponent):
+    """
+    Evaluate K_m * (1 + u^2/m)^exponent with K_m and exponent already computed,
+    so repeated evaluations for the same m skip the gamma calls (see _K_m).
+    """
+    u = np.asarray(u, dtype=float)
+    return K_m * (1.0 + u*u/m)**exponent
+
+def _t_pdf_for(m):
+    """
+    Return the t PDF for fixed m as a one-argument function f(u) for the integrators.
+    K_m and the exponent depend only on m, so they are computed once here rather than per node.
     """
-    # Compute K_m once
-    K_m = gamma((m+1)/2.0) / ( math.sqrt(m*math.pi) * gamma(m/2.0) )
-    return K_m * (1.0 + (u**2)/m)** (-(m+1)/2.0)
+    K_m = _K_m(m)
+    exponent = -(m+1)/2.0
+
+    def f(u):
+        return _t_pdf_kernel(u, m, K_m, exponent)
+
+    return f
+
+@functools.lru_cache(maxsize=32)
+def _simpson_weights(N):
+    """
+    Simpson's 1/3 rule weights [1, 4, 2, 4, ..., 2, 4, 1] for N (even) subintervals.
+    Cached per N and returned read-only, since the same array is shared between calls.
+    """
+    w = np.empty(N+1)
+    w[0] = w[-1] = 1.0
+    w[1:-1:2] = 4.0  # interior odd nodes
+    w[2:-1:2] = 2.0  # interior even nodes
+    w.flags.writeable = False
+    return w
 
 def simpson_integration(f, a, b, N=200):
     """
     Numerically integrate f(x) from x=a to x=b using Simpson's 1/3 rule with N subintervals.
     N must be even. If N is odd, we add 1.
+    f must accept a NumPy array of x values and return an array of the same shape (or a scalar,
+    which is broadcast to every node).
     """
     if N % 2 != 0:
         N += 1
 
     h = (b - a) / N
-    total = f(a) + f(b)
-
-    # Sum terms
-    odd_sum = 0.0
-    even_sum = 0.0
-    for i in range(1, N):
-        x_i = a + i*h
-        fx_i = f(x_i)
-        if i % 2 == 1:
-            odd_sum += fx_i
-        else:
-            even_sum += fx_i
-
-    total += 4.0*odd_sum + 2.0*even_sum
-    return (h/3.0)*total
+    # Evaluate f at all N+1 nodes in a single vectorized call
+    x = a + np.arange(N+1)*h
+    # Broadcast so an f that returns a scalar (e.g. a constant) still yields one value per node
+    y = np.broadcast_to(np.asarray(f(x), dtype=float), x.shape)
+
+    # Weighted sum of all nodes as a single dot product
+    return float((h/3.0)*(_simpson_weights(N) @ y))
 
 def t_cdf(z, m):
     """
-    Numerically approximate the CDF of the t-distribution with m degrees of freedom:
+    CDF of the t-distribution with m degrees of freedom:
        F(z) = integral_{-infinity}^{z} t_pdf(u, m) du.
-    We'll truncate "infinity" at a large negative number for practical integration.
+    Evaluated directly with scipy.special.stdtr (a single C call) rather than by quadrature.
     """
-    # If z is very large negative, F(z) ~ 0. If z is very large positive, F(z) ~ 1.
-    # We'll pick a sufficiently large negative bound, say -10 or -12 or even -20,
-    # depending on how far out your table typically goes.
-    NEG_BOUND = -10.0
-    if z < -10:
-        NEG_BOUND = min(z - 1.0, -10.0)  # if user picks z < -10, shift the bound a bit further
+    return float(stdtr(m, z))
 
-    # If z is very large, the integral from -∞ to z ~ 1, but we'll just do up to z.
-    # If z < NEG_BOUND, we'll get a very small probability.
-    def f(x):
-        return t_pdf(x, m)
-
-    return simpson_integration(f, NEG_BOUND, z, N=300)
-
-def main():
+def t_cdf_quad(z, m):
     """
-    Prompts user for m (degrees of freedom) and z, computes F(z).
-    You can run multiple times and compare with Table A9.
+    Numerically approximate the CDF of the t-distribution with m degrees of freedom:
+       F(z) = integral_{-infinity}^{z} t_pdf(u, m) du.
+    Kept for comparison against t_cdf; it integrates t_pdf with adaptive quadrature
+    (scipy.integrate.quad, QUADPACK Gauss-Kronrod with error control) instead of a fixed N.
+    """
+    # By symmetry about 0 the CDF follows from the upper tail beyond |z|:
+    #   F(z) = 1 - integral_|z|^inf  for z >= 0
+    #   F(z) =     integral_|z|^inf  for z < 0
+    # QUADPACK maps the semi-infinite tail onto a finite interval.  Integrating [0, |z|] instead
+    # misses the peak at 0 for large |z| (e.g. z=1e6 returned 0.5).
+    tail, _ = quad(_t_pdf_for(m), abs(z), np.inf, epsabs=1e-10)
+    return 1.0 - tail if z >= 0 else tail
+
+def t_cdf_simpson(z, m, N=150, z_cap=10.0):
     """
-    print("This program computes the t-distribution CDF:")
-    print("    F(z) = Km * ∫ from -∞ to z of (1 + u^2/m)^(-(m+1)/2) du\n")
+    Numerically approximate the CDF of the t-distribution with m degrees of freedom using
+    Simpson's 1/3 rule (simpson_integration), with F(z) = 0.5 +/- integral_0^|z| t_pdf(u, m) du.
+    The interval [0, |z|] is split at z_cap so a fixed node budget stays accurate for any z:
+      - [0, min(|z|, z_cap)] is integrated directly, with N scaled to its length (adaptive N),
+      - [z_cap, |z|] is integrated after substituting u = 1/v, which maps it to the short
+        interval [1/|z|, 1/z_cap] where the integrand t_pdf(1/v, m)/v^2 is smooth.
+    Kept for comparison against t_cdf and t_cdf_quad.
+    :param N: subintervals for a full [0, z_cap] span (and for the substituted tail)
+    """
+    az = abs(z)
+    f = _t_pdf_for(m)
+
+    # Body: fewer nodes for small |z|, N nodes for a full z_cap span
+    body_end = min(az, z_cap)
+    N_body = max(10, int(math.ceil(N * body_end / z_cap)))
+    half = simpson_integration(f, 0.0, body_end, N=N_body)
 
-    Again = True
-    while Again:
-        # 1) Ask for degrees of freedom, m
-        m_str = input("Enter degrees of freedom (m): ").strip()
-        if not m_str:
-            print("No input received. Exiting.")
-            break
-        m = float(m_str)
+    if az > z_cap:
+        # t_pdf(1/v, m) / v^2 written out so it stays finite as v -> 0 (z -> inf)
+        K_m = _K_m(m)
 
-        # 2) Ask for z
-        z_str = input("Enter z-value: ").strip()
-        if not z_str:
-            print("No z given. Exiting.")
-            break
-        z_val = float(z_str)
+        def g(v):
+            return K_m * v**(m-1) * (v*v + 1.0/m)**(-(m+1)/2.0)
 
-        # 3) Compute CDF
-        cdf_val = t_cdf(z_val, m)
+        half += simpson_integration(g, 1.0/az, 1.0/z_cap, N=N)
 
-        # 4) Display result
-        print(f"\nFor m = {m}, z = {z_val},  F(z) ≈ {cdf_val:.6f}\n")
+    F = 0.5 + half if z >= 0 else 0.5 - half
+    return min(1.0, max(0.0, F))  # a CDF cannot leave [0, 1]; guard against rounding
 
-        # 5) Go again?
-        again_str = input("Compute another? (y/n): ").lower().strip()
-        if again_str not in ['y', 'yes']:
-            Again = False
+def main(compare=False):
+    """
+    Prompts user for m (degrees of freedom) and z, computes F(z).
+    You can run multiple times and compare with Table A9.
+    :param compare: if True (run with --compare), also print the numerically integrated
+                    values from t_cdf_quad and t_cdf_simpson next to F(z)
+    """
+    ask, say, flush = make_io()
+
+    try:
+        say("This program computes the t-distribution CDF:")
+        say("    F(z) = Km * ∫ from -∞ to z of (1 + u^2/m)^(-(m+1)/2) du\n")
+
+        Again = True
+        while Again:
+            # 1) Ask for degrees of freedom, m
+            m_str = ask("Enter degrees of freedom (m): ").strip()
+            if not m_str:
+                say("No input received. Exiting.")
+                break
+            m = float(m_str)
+
+            # 2) Ask for z
+            z_str = ask("Enter z-value: ").strip()
+            if not z_str:
+                say("No z given. Exiting.")
+                break
+            z_val = float(z_str)
+
+            # 3) Compute CDF
+            cdf_val = t_cdf(z_val, m)
+
+            # 4) Display result
+            if compare:
+                # Numerical integrals of t_pdf, for checking against the closed form
+                say(f"\nFor m = {m}, z = {z_val},  F(z) ≈ {cdf_val:.6f}")
+                say(f"    numerical integration (quad):    {t_cdf_quad(z_val, m):.6f}")
+                say(f"    Simpson's 1/3 rule:              {t_cdf_simpson(z_val, m):.6f}\n")
+            else:
+                say(f"\nFor m = {m}, z = {z_val},  F(z) ≈ {cdf_val:.6f}\n")
+
+            # 5) Go again?
+            again_str = ask("Compute another? (y/n): ").lower().strip()
+            if again_str not in ['y', 'yes']:
+                Again = False
+    finally:
+        flush()  # write whatever was produced, even if an exception was raised
 
 if __name__ == "__main__":
-    main()
+    main(compare="--compare" in sys.argv[1:])
@@ -1,6 +1,16 @@
 import DoolittleMethod as dm
-import Gauss_Seidel as gs
-import random
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve
+
+
+def _is_square_symmetric(A):
+    """
+    Return True if the 2D array A is square and exactly symmetric (A == A.T).
+
+    The check is exact (as the original list comparison was) because cho_factor only reads the
+    lower triangle, so a nearly-symmetric matrix must not slip through a tolerance.
+    """
+    return A.ndim == 2 and A.shape[0] == A.shape[1] and np.array_equal(A, A.T)
 
 
 def decompose_cholesky(matrix_aug):
@@ -9,90 +19,35 @@ def decompose_cholesky(matrix_aug):
 
     The function:
       1. Separates the augmented matrix into A and b.
-      2. Builds a lower triangular matrix L such that A = L * L^T.
-      3. Uses forward substitution (L y = b) and backward substitution (L^T x = y) to find the solution x.
+      2. Factors A = L * L^T with scipy.linalg.cho_factor (LAPACK dpotrf).
+      3. Solves L y = b and L^T x = y with scipy.linalg.cho_solve (LAPACK dpotrs).
 
     Args:
-        matrix_aug (list of lists): Augmented matrix of the form [A|b].
+        matrix_aug (list of lists or numpy.ndarray): Augmented matrix of the form [A|b].
 
     Returns:
         tuple: (x, lower, upper)
-            x (list): The solution vector to A x = b.
-            lower (list): The lower triangular matrix L.
-            upper (list): The upper triangular matrix, which is the transpose of L (L^T).
+            x (numpy.ndarray): The solution vector to A x = b.
+            lower (numpy.ndarray): The lower triangular matrix L.
+            upper (numpy.ndarray): The upper triangular matrix, which is the transpose of L (L^T).
+
+    Raises:
+        numpy.linalg.LinAlgError: If A is not symmetric positive definite, so callers can fall back
+            to another method without factoring A a second time.
     """
+    aug = np.asarray(matrix_aug, dtype=np.float64, order='C')
+    A, b = aug[:, :-1], aug[:, -1]  # views into aug, no copies
+
+    if not _is_square_symmetric(A):
+        raise np.linalg.LinAlgError("Cholesky decomposition requires a square symmetric matrix.")
 
-    def compute_transpose(matrix):
-        """
-        Return the transpose of a 2D list (matrix).
-
-        Args:
-            matrix (list of lists): A square or rectangular matrix.
-
-        Returns:
-            list of lists: The transpose of the input matrix.
-        """
-        return [[matrix[j][i] for j in range(len(matrix))] for i in range(len(matrix[0]))]
-
-    def forward_substitution(lower, vector):
-        """
-        Solve lower * y = vector using forward substitution.
-
-        Args:
-            lower (list of lists): A lower triangular matrix (n x n).
-            vector (list): A right-hand side vector of length n.
-
-        Returns:
-            list: The solution vector y of length n.
-        """
-        n = len(vector)
-        y = [0.0] * n
-        for i in range(n):
-            y[i] = (vector[i] - sum(lower[i][j] * y[j] for j in range(i))) / lower[i][i]
-        return y
-
-    def backward_substitution(upper, vector):
-        """
-        Solve upper * x = vector using backward substitution.
-
-        Args:
-            upper (list of lists): An upper triangular matrix (n x n).
-            vector (list): A right-hand side vector of length n.
-
-        Returns:
-            list: The solution vector x of length n.
-        """
-        n = len(vector)
-        x = [0.0] * n
-        for i in range(n - 1, -1, -1):
-            x[i] = (vector[i] - sum(upper[i][j] * x[j] for j in range(i + 1, n))) / upper[i][i]
-        return x
-
-    matrix, vector = gs.separateAugmented(matrix_aug)
-
-    # Flatten vector if it is nested
-    if isinstance(vector[0], list):
-        vector = [item for sublist in vector for item in sublist]
-
-    size = len(matrix)
-    lower = [[0.0] * size for _ in range(size)]
-
-    # Construct the lower triangular matrix (Cholesky factor)
-    for i in range(size):
-        for j in range(i + 1):
-            if i == j:
-                sum_sq = sum(lower[i][k] ** 2 for k in range(j))
-                lower[i][j] = (matrix[i][j] - sum_sq) ** 0.5
-            else:
-                sum_prod = sum(lower[i][k] * lower[j][k] for k in range(j))
-                lower[i][j] = (matrix[i][j] - sum_prod) / lower[j][j]
-
-    # Transpose of the lower matrix
-    upper = compute_transpose(lower)
-
-    # Solve for x using forward and backward substitution
-    y = forward_substitution(lower, vector)
-    x = backward_substitution(upper, y)
+    # cho_factor raises LinAlgError if A is not positive definite.
+    # It leaves garbage above the diagonal, so keep only the lower triangle for L
+    factor, low = cho_factor(A, lower=True)
+    x = cho_solve((factor, low), b)
+
+    lower = np.tril(factor)
+    upper = lower.T
 
     return x, lower, upper
 
@@ -101,50 +56,36 @@ def check_symmetric_positive_definite(matrix):
     """
     Check if a matrix is symmetric and positive definite.
 
-    The function first verifies symmetry by comparing matrix[i][j] with matrix[j][i].
-    It then generates a random vector and calculates x^T * matrix * x to see if it is strictly positive.
+    The function first verifies the matrix is square and exactly symmetric (A == A.T).
+    It then attempts a Cholesky factorization, which succeeds if and only if the matrix is positive definite.
 
     Args:
-        matrix (list of lists): The square matrix to check.
+        matrix (list of lists or numpy.ndarray): The square matrix to check.
 
     Returns:
         bool: True if the matrix is symmetric and positive definite, False otherwise.
     """
+    A = np.asarray(matrix, dtype=np.float64)
 
-    def compute_transpose(matrix):
-        """
-        Return the transpose of a 2D list (matrix).
-
-        Args:
-            matrix (list of lists): A square or rectangular matrix.
-
-        Returns:
-            list of lists: The transpose of the input matrix.
-        """
-        return [[matrix[j][i] for j in range(len(matrix))] for i in range(len(matrix[0]))]
-
-    transpose_matrix = compute_transpose(matrix)
     # Check symmetry
-    if matrix != transpose_matrix:
+    if not _is_square_symmetric(A):
         return False
 
     # Check positive definiteness
-    random_vector = [random.uniform(-1, 1) for _ in range(len(matrix))]
-    quadratic_form = sum(
-        random_vector[i] * sum(matrix[i][j] * random_vector[j] for j in range(len(matrix)))
-        for i in range(len(matrix))
-    )
-
-    return quadratic_form > 0
+    try:
+        np.linalg.cholesky(A)
+    except np.linalg.LinAlgError:
+        return False
+    return True
 
 
 def execute_main():
     """
     Demonstrate solving multiple augmented matrices with either Cholesky or Doolittle.
 
-    1. Predefined augmented matrices are each split into (A, b).
-    2. For each matrix, if it is symmetric positive definite, solve by Cholesky.
-       Otherwise, solve by Doolittle.
+    1. Predefined augmented matrices are converted to contiguous float64 arrays.
+    2. For each matrix, try to solve by Cholesky; decompose_cholesky raises LinAlgError if A is not
+       symmetric positive definite, in which case solve by Doolittle.
     3. Print the solutions and the corresponding method used.
     """
     matrices = [
@@ -153,17 +94,15 @@ def execute_main():
     ]
 
     for index, matrix in enumerate(matrices, start=1):
-        A, b = gs.separateAugmented(matrix)
-
-        # Flatten b if it's nested
-        if isinstance(b[0], list):
-            b = [item for sublist in b for item in sublist]
+        aug = np.asarray(matrix, dtype=np.float64, order='C')
 
-        if check_symmetric_positive_definite(A):
-            solution, _, _ = decompose_cholesky(matrix)
+        # Attempting the factorization is the SPD test, so A is only factored once
+        try:
+            solution, _, _ = decompose_cholesky(aug)
+            solution = solution.tolist()  # print as a list, like the Doolittle branch
             method_name = "Cholesky"
-        else:
-            solution = dm.Doolittle(matrix)
+        except np.linalg.LinAlgError:
+            solution = dm.Doolittle(matrix)  # Doolittle works on the original list of lists
             method_name = "Doolittle"
 
         print(f"Solution for Matrix {index} using {method_name} method: {solution}\n")